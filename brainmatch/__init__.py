@@ -0,0 +1,2 @@
+# Register the bundled matching engines
+from brainmatch import bitset  # noqa: F401
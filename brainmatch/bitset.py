@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from brainmatch.brainmatch import (
+    label_separator, project_id_field, project_labels_field,
+    email_address_field, experience_git_skills_field,
+    experience_modality_field, experience_programming_field,
+    experience_tools_field, experience_topic_field, desired_modality_field,
+    desired_programming_field, desired_tools_field, desired_topic_field,
+    git_skills_label, modality_label, programming_label, tools_label,
+    topic_label, git_skills_pattern, get_project_git_skills,
+    get_projects_features, register_match_engine)
+
+
+bitset_engine_name = "bitset"
+
+word_size = 64
+default_block_size = 4096
+
+# Feature families and the contributor fields scored against them, in the
+# order in which the scores are accumulated
+scored_fields = [
+    (modality_label, experience_modality_field),
+    (programming_label, experience_programming_field),
+    (tools_label, experience_tools_field),
+    (topic_label, experience_topic_field),
+    (modality_label, desired_modality_field),
+    (programming_label, desired_programming_field),
+    (tools_label, desired_tools_field),
+    (topic_label, desired_topic_field)]
+
+_byte_popcount = np.array(
+    [bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(masks):
+    """Count the set bits of packed bitmasks along their last axis.
+
+    Parameters
+    ----------
+    masks : ndarray
+        Packed bitmasks (uint64).
+
+    Returns
+    -------
+    ndarray
+        Set bit count of each bitmask.
+    """
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks).sum(axis=-1, dtype=np.int64)
+
+    counts = _byte_popcount[masks.view(np.uint8)]
+
+    return counts.sum(axis=-1, dtype=np.int64)
+
+
+def pack_label_sets(rows, bits, row_count, label_count):
+    """Pack label sets into uint64 bitmasks.
+
+    Parameters
+    ----------
+    rows : ndarray
+        Row of each label occurrence.
+    bits : ndarray
+        Vocabulary index of each label occurrence.
+    row_count : int
+        Row count.
+    label_count : int
+        Vocabulary size.
+
+    Returns
+    -------
+    masks : ndarray
+        Bitmasks (rows x words).
+    """
+
+    word_count = max(1, -(-label_count // word_size))
+    masks = np.zeros((row_count, word_count), dtype=np.uint64)
+
+    bits = np.asarray(bits, dtype=np.uint64)
+    np.bitwise_or.at(
+        masks, (np.asarray(rows, dtype=np.intp),
+                (bits // word_size).astype(np.intp)),
+        np.left_shift(np.uint64(1), bits % np.uint64(word_size)))
+
+    return masks
+
+
+def compile_project_label_sets(projects_df):
+    """Compile the project labels into per feature family vocabularies and
+    bitmasks.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+
+    Returns
+    -------
+    git_skills : ndarray
+        Required git skill level of each project; -1 if the project does not
+        require any git skill.
+    vocabularies : dict
+        Label vocabulary of each feature family.
+    masks : dict
+        Label bitmasks of each feature family (projects x words).
+    counts : dict
+        Label count of each project for each feature family.
+    nzero_feature_count : ndarray
+        Label count of each project.
+    """
+
+    families = sorted(set(family for family, _ in scored_fields))
+
+    proj_features = [get_projects_features(labels)
+                     for labels in projects_df[project_labels_field]]
+
+    git_skills = np.array(
+        [get_project_git_skills(features[git_skills_label])
+         for features in proj_features])
+
+    nzero_feature_count = np.array(
+        [sum(len(val) for val in features.values())
+         for features in proj_features], dtype=float)
+
+    vocabularies = dict()
+    masks = dict()
+    counts = dict()
+
+    for family in families:
+        vocabulary = dict()
+        rows = []
+        bits = []
+        for row, features in enumerate(proj_features):
+            for label in features[family]:
+                rows.append(row)
+                bits.append(vocabulary.setdefault(label, len(vocabulary)))
+
+        vocabularies[family] = vocabulary
+        masks[family] = pack_label_sets(
+            rows, bits, len(proj_features), len(vocabulary))
+        # Duplicate labels count towards the number of required labels
+        counts[family] = np.array(
+            [len(features[family]) for features in proj_features])
+
+    return git_skills, vocabularies, masks, counts, nzero_feature_count
+
+
+def compile_contributor_label_sets(contributors_df, vocabularies):
+    """Compile the contributor labels into bitmasks over the project
+    vocabularies. Labels absent from the project vocabularies are dropped as
+    they cannot match any project.
+
+    Parameters
+    ----------
+    contributors_df : DataFrame
+        Contributor data.
+    vocabularies : dict
+        Label vocabulary of each feature family.
+
+    Returns
+    -------
+    git_skills : ndarray
+        Git skill level of each contributor.
+    masks : dict
+        Label bitmasks of each contributor field (contributors x words).
+    """
+
+    contributor_count = len(contributors_df)
+    contributors_df = contributors_df.reset_index(drop=True)
+
+    git_skills = contributors_df[experience_git_skills_field].str.extract(
+        git_skills_pattern, expand=False).astype(int).to_numpy()
+
+    masks = dict()
+
+    for family, field in scored_fields:
+        labels = contributors_df[field].str.split(
+            label_separator).explode().str.strip()
+        bits = labels.map(vocabularies[family]).dropna()
+        masks[field] = pack_label_sets(
+            bits.index, bits.astype(int), contributor_count,
+            len(vocabularies[family]))
+
+    return git_skills, masks
+
+
+def match_bitset(projects_df, contributors_df,
+                 block_size=default_block_size):
+    """Compute the contributor to project matching using packed label
+    bitmasks. Label set overlaps are computed as the popcount of the AND of
+    the contributor and project bitmasks, for blocks of contributors against
+    all projects at once. The scores are the same as the ones computed by
+    :func:`~brainmatch.brainmatch.match`.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+    contributors_df : DataFrame
+        Contributor data.
+    block_size : int, optional
+        Number of contributors scored at once.
+
+    Returns
+    -------
+    match_df : DataFrame
+        Contributor to project matching data.
+    """
+
+    proj_git_skills, vocabularies, proj_masks, proj_counts, \
+        nzero_feature_count = compile_project_label_sets(projects_df)
+    contrib_git_skills, contrib_masks = \
+        compile_contributor_label_sets(contributors_df, vocabularies)
+
+    scores = np.empty((len(contributors_df), len(projects_df)))
+
+    for start in range(0, len(contributors_df), block_size):
+        block = slice(start, start + block_size)
+
+        git_skills = contrib_git_skills[block, None]
+        score = ((git_skills >= proj_git_skills) &
+                 (proj_git_skills > 0)).astype(float)
+
+        # Accumulate in the same order as the reference scoring method. The
+        # overlap is 0 for projects without any label in the family.
+        for family, field in scored_fields:
+            overlap = popcount(
+                contrib_masks[field][block, None, :] &
+                proj_masks[family][None, :, :])
+            score += overlap / np.maximum(proj_counts[family], 1)
+
+        scores[block] = score / nzero_feature_count
+
+    project_ids = list(map(str, projects_df[project_id_field].tolist()))
+
+    match_df = pd.DataFrame(scores, columns=project_ids)
+    match_df.insert(
+        0, email_address_field, contributors_df[email_address_field].tolist())
+
+    return match_df
+
+
+register_match_engine(bitset_engine_name, match_bitset)
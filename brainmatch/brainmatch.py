@@ -3,6 +3,7 @@
 
 import functools
 import operator
+import re
 
 import pandas as pd
 
@@ -14,6 +15,9 @@ label_separator = ","
 project_top_id_label = "id"
 score_id_label = "score"
 
+previous_projects_label = "previous_projects"
+current_projects_label = "current_projects"
+
 project_id_field = "ID"
 project_labels_field = "LABELS"
 
@@ -56,6 +60,18 @@ feature_keys = [git_skills_label, modality_label, programming_label,
                 project_type_label, project_tools_skills_label,
                 tools_label, topic_label]
 
+row_label = "row"
+field_label = "field"
+value_label = "value"
+reason_label = "reason"
+
+missing_value_reason = "missing value"
+missing_git_skills_reason = "no git skill level"
+
+# The git skill level is the first whitespace separated token made only of
+# digits, captured by the pattern group
+git_skills_pattern = r"(?:^| )(\d+)(?= |$)"
+
 
 def _generate_top_match_column_names(n):
     """Generate top match column names to host information (project identifier
@@ -133,6 +149,79 @@ def compute_top_n(match_df, n):
     return top_match_df
 
 
+def _join_top_n_project_ids(top_match_df):
+    """Join the ranked project identifiers of each contributor into a single
+    string.
+
+    Parameters
+    ----------
+    top_match_df : DataFrame
+        Top-n rank contributor matching data.
+
+    Returns
+    -------
+    Series
+        Ranked project identifiers of each contributor, indexed by the
+        contributor email address. Only the last row of a contributor
+        registered more than once is kept.
+    """
+
+    id_col_names = [
+        col_name for col_name in top_match_df.columns
+        if col_name.startswith(project_top_id_label + underscore)]
+
+    # Concatenate whole columns rather than joining each row
+    project_ids = pd.Series("", index=top_match_df.index)
+    for i, col_name in enumerate(id_col_names):
+        project_ids += (label_separator if i else "") + \
+            top_match_df[col_name].astype(str)
+
+    project_ids.index = top_match_df[email_address_field]
+
+    # Keep the latest registration of contributors registered more than once
+    project_ids = project_ids[~project_ids.index.duplicated(keep="last")]
+
+    return project_ids
+
+
+def compare_top_n(previous_top_match_df, current_top_match_df):
+    """Compare the top-n project ranks of two runs and keep the contributors
+    whose ranked projects changed. Contributors present in a single run are
+    considered to have changed. If a contributor appears more than once in a
+    run, only their last row is compared.
+
+    Parameters
+    ----------
+    previous_top_match_df : DataFrame
+        Previous top-n rank contributor matching data.
+    current_top_match_df : DataFrame
+        Current top-n rank contributor matching data.
+
+    Returns
+    -------
+    diff_df : DataFrame
+        Previous and current ranked projects of the contributors whose ranks
+        changed. Project identifiers are separated by commas, and are empty if
+        the contributor is not present in a run.
+    """
+
+    previous_ids = _join_top_n_project_ids(previous_top_match_df)
+    current_ids = _join_top_n_project_ids(current_top_match_df)
+
+    diff_df = pd.merge(
+        previous_ids.rename(previous_projects_label),
+        current_ids.rename(current_projects_label),
+        how="outer", left_index=True, right_index=True, sort=False,
+        validate="one_to_one").fillna("")
+
+    changed = \
+        diff_df[previous_projects_label] != diff_df[current_projects_label]
+
+    diff_df = diff_df[changed].reset_index()
+
+    return diff_df
+
+
 def get_projects_features(project_data):
     """Get the project features under the form of a dictionary from the
     provided data string.
@@ -161,6 +250,47 @@ def get_projects_features(project_data):
     return project_features
 
 
+def get_project_git_skills(proj_git_skills):
+    """Get the git skill level required by a project from its git skill
+    labels. The labels are sorted in ascending order as strings and the last
+    one is taken as the most demanding one.
+
+    Parameters
+    ----------
+    proj_git_skills : list
+        Project git skill labels.
+
+    Returns
+    -------
+    int
+        Required git skill level; -1 if the project does not require any git
+        skill.
+    """
+
+    if not proj_git_skills:
+        return -1
+
+    return int(sorted(proj_git_skills)[-1].split(underscore)[0])
+
+
+def get_contributor_git_skills(contrib_git_skills):
+    """Get the git skill level of a contributor from their git experience.
+
+    Parameters
+    ----------
+    contrib_git_skills : str
+        Contributor git experience, where the integer indicating the skill
+        level is separated from its meaning by a whitespace.
+
+    Returns
+    -------
+    int
+        Git skill level.
+    """
+
+    return int(re.search(git_skills_pattern, contrib_git_skills).group(1))
+
+
 def compute_feature_score(proj_feature, contrib_feature):
     """Compute the score of the contributor features with respect to the
     required project features. The score is computed as ratio of the number of
@@ -215,19 +345,12 @@ def compute_total_score(proj_features, contrib_data):
 
     nzero_feature_count = sum(len(val) for val in proj_features.values())
 
-    # Assume that the integer indicating the skill is separated from the its
-    # meaning by a whitespace
-    contrib_git_skills = [int(s) for s in contrib_data[
-        experience_git_skills_field].split(" ") if s.isdigit()][0]
-
-    # Sort the git skills labels in ascending order and take the highest skill
-    # level if more than one git skill label are given to a project.
-    proj_features[git_skills_label] = \
-        sorted(proj_features[git_skills_label])[-1]
+    contrib_git_skills = get_contributor_git_skills(
+        contrib_data[experience_git_skills_field])
 
-    proj_git_skills = int(
-        proj_features[git_skills_label].split(underscore)[0]
-        if proj_features[git_skills_label] else -1)
+    # Take the highest skill level if more than one git skill label are given
+    # to a project.
+    proj_git_skills = get_project_git_skills(proj_features[git_skills_label])
 
     # Split the dataframe strings into lists
     contrib_experience_modality = \
@@ -282,10 +405,10 @@ def compute_total_score(proj_features, contrib_data):
     return score/nzero_feature_count
 
 
-def match(projects_df, contributors_df):
-    """Compute the contributor to project matching. Provides a score
-    determining the fit or match of a given contributor with respect to the
-    event projects.
+def match_reference(projects_df, contributors_df):
+    """Compute the contributor to project matching by scoring each
+    contributor and project pair with :func:`compute_total_score`. This is
+    the reference engine that other matching engines must agree with.
 
     Parameters
     ----------
@@ -328,6 +451,72 @@ def match(projects_df, contributors_df):
     return match_df
 
 
+reference_engine_name = "reference"
+match_engines = dict()
+
+
+def register_match_engine(name, engine):
+    """Register a contributor to project matching engine. Engines take the
+    project and the contributor data, and return the contributor to project
+    matching data; their scores must agree with the ones of the reference
+    engine.
+
+    Parameters
+    ----------
+    name : str
+        Engine name.
+    engine : callable
+        Engine.
+    """
+
+    match_engines[name] = engine
+
+
+def get_match_engine(name):
+    """Get a registered contributor to project matching engine.
+
+    Parameters
+    ----------
+    name : str
+        Engine name.
+
+    Returns
+    -------
+    callable
+        Engine.
+    """
+
+    if name not in match_engines:
+        raise ValueError("Unknown matching engine: {}\n"
+                         "Available engines: {}".
+                         format(name, sorted(match_engines)))
+
+    return match_engines[name]
+
+
+def match(projects_df, contributors_df, engine=reference_engine_name):
+    """Compute the contributor to project matching. Provides a score
+    determining the fit or match of a given contributor with respect to the
+    event projects.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+    contributors_df : DataFrame
+        Contributor data.
+    engine : str, optional
+        Name of the matching engine.
+
+    Returns
+    -------
+    match_df : DataFrame
+        Contributor to project matching data.
+    """
+
+    return get_match_engine(engine)(projects_df, contributors_df)
+
+
 def filter_event_projects(event, projects_df):
     """Retrieve project data corresponding to the given event.
 
@@ -383,6 +572,105 @@ def check_necessary_contributor_data(contributors_df):
                          format(indices, necessary_indices, list(missing)))
 
 
+def validate_contributor_data(contributors_df, first_row=1):
+    """Validate the values of the necessary contributor fields. Contributors
+    must provide a value for each necessary field, and their git skill level
+    must contain an integer separated from its meaning by a whitespace.
+    Non-text values (e.g. bare numbers) are reported as missing values. The
+    checks are performed on whole columns at once.
+
+    Parameters
+    ----------
+    contributors_df : DataFrame
+        Contributor data.
+    first_row : int, optional
+        Row number of the first contributor (e.g. when validating a chunk of
+        the contributor file).
+
+    Returns
+    -------
+    invalid_df : DataFrame
+        Invalid contributor data: the row number (starting at 1 for the first
+        contributor), the field name, the value and the reason of each invalid
+        value.
+    """
+
+    rows = pd.Series(range(first_row, first_row + len(contributors_df)),
+                     index=contributors_df.index)
+
+    invalid = []
+
+    for field in necessary_indices:
+        values = contributors_df[field].astype(object)
+        # Non-string values (e.g. empty cells, or columns read as numbers)
+        # cannot be scored and are checked as empty cells
+        text = values.where(
+            values.map(lambda value: isinstance(value, str))).astype(object)
+        missing = text.str.strip().str.len().fillna(0) == 0
+        reasons = pd.Series(missing_value_reason, index=values.index)
+
+        if field == experience_git_skills_field:
+            no_level = text.str.extract(
+                git_skills_pattern, expand=False).isna()
+            reasons[no_level & ~missing] = missing_git_skills_reason
+            missing |= no_level
+
+        invalid.append(pd.DataFrame({
+            row_label: rows[missing], field_label: field,
+            value_label: values[missing], reason_label: reasons[missing]}))
+
+    invalid_df = pd.concat(invalid)
+    invalid_df.sort_values(row_label, kind="stable", inplace=True)
+
+    return invalid_df
+
+
+def report_invalid_contributor_data(invalid_df):
+    """Stop if any invalid contributor value was found. All invalid values are
+    reported at once.
+
+    Parameters
+    ----------
+    invalid_df : DataFrame
+        Invalid contributor data, as returned by
+        :func:`validate_contributor_data`.
+    """
+
+    if not invalid_df.empty:
+        raise ValueError("The script cannot continue.\n"
+                         "Your contributor file contains invalid data:\n"
+                         "{}".format(invalid_df.to_string(index=False)))
+
+
+def quarantine_contributor_data(contributors_df):
+    """Split the contributor data into valid and invalid contributors.
+
+    Parameters
+    ----------
+    contributors_df : DataFrame
+        Contributor data.
+
+    Returns
+    -------
+    valid_df : DataFrame
+        Valid contributor data.
+    quarantined_df : DataFrame
+        Invalid contributor data, with an additional column describing the
+        invalid fields.
+    """
+
+    invalid_df = validate_contributor_data(contributors_df)
+
+    is_invalid = contributors_df.index.isin(invalid_df.index)
+
+    quarantined_df = contributors_df[is_invalid].copy()
+    quarantined_df[reason_label] = (
+        invalid_df[field_label] + ": " + invalid_df[reason_label]).groupby(
+        level=0).agg("; ".join)
+
+    return contributors_df[~is_invalid], quarantined_df
+
+
 def normalize_contributors(contributors_df, contributor_fields):
     """Normalize contributor data: strip leading and trailing whitespaces in
     column headers, and rename them according to the provided contributor
@@ -406,3 +694,6 @@ def normalize_contributors(contributors_df, contributor_fields):
 
     contributors_df.rename(
         columns={y: x for x, y in contributor_fields.items()}, inplace=True)
+
+
+register_match_engine(reference_engine_name, match_reference)
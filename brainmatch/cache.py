@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+from importlib.metadata import PackageNotFoundError, version
+
+import pandas as pd
+
+from brainmatch.brainmatch import reference_engine_name
+
+
+package_name = "brainmatch"
+unknown_version = "unknown"
+
+cache_extension = ".csv"
+default_cache_dir = os.path.join(
+    os.path.expanduser("~"), ".cache", package_name)
+# Maximum size (in bytes) of the cached score matrices kept on disk
+default_cache_max_size = 256 * 1024 * 1024
+
+hash_chunk_size = 1 << 16
+
+source_dir = os.path.dirname(os.path.abspath(__file__))
+source_extension = ".py"
+
+
+def get_library_version():
+    """Get the installed library version.
+
+    Returns
+    -------
+    str
+        Library version; ``unknown`` if the package metadata is not available.
+    """
+
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return unknown_version
+
+
+def _update_file_hash(file_hash, fname):
+    """Feed the contents of the given file to the hash object.
+
+    Parameters
+    ----------
+    file_hash : hash object
+        Hash object to be updated.
+    fname : str
+        Filename.
+    """
+
+    with open(fname, 'rb') as f:
+        for chunk in iter(lambda: f.read(hash_chunk_size), b""):
+            file_hash.update(chunk)
+
+
+def compute_source_hash():
+    """Compute a hash of the library source files, so that scores computed by
+    a modified scoring code are never reused, even if the installed library
+    version is unchanged (e.g. in editable installs).
+
+    Returns
+    -------
+    str
+        Library source hash.
+    """
+
+    source_hash = hashlib.sha256()
+
+    for basename in sorted(os.listdir(source_dir)):
+        if basename.endswith(source_extension):
+            source_hash.update(basename.encode("utf-8"))
+            _update_file_hash(source_hash, os.path.join(source_dir, basename))
+
+    return source_hash.hexdigest()
+
+
+def compute_cache_key(event, projects_fname, contributors_fname,
+                      contributors_fields_fname, engine=reference_engine_name,
+                      lib_version=None, source_hash=None):
+    """Compute the cache key identifying a contributor to project matching
+    run. The key is a hash of the contents of the input files, the event
+    label, the matching engine, the library version and the library source
+    files, so that any change in the inputs or in the scoring code results in
+    a different key.
+
+    Parameters
+    ----------
+    event : str
+        Event.
+    projects_fname : str
+        Projects filename.
+    contributors_fname : str
+        Contributors filename.
+    contributors_fields_fname : str
+        Contributors fields filename.
+    engine : str, optional
+        Name of the matching engine.
+    lib_version : str, optional
+        Library version. Defaults to the installed library version.
+    source_hash : str, optional
+        Library source hash. Defaults to the hash of the library source files.
+
+    Returns
+    -------
+    str
+        Cache key.
+    """
+
+    if lib_version is None:
+        lib_version = get_library_version()
+
+    if source_hash is None:
+        source_hash = compute_source_hash()
+
+    key_hash = hashlib.sha256()
+
+    for fname in [projects_fname, contributors_fname,
+                  contributors_fields_fname]:
+        file_hash = hashlib.sha256()
+        _update_file_hash(file_hash, fname)
+        key_hash.update(file_hash.digest())
+
+    for value in [event, engine, lib_version, source_hash]:
+        key_hash.update(hashlib.sha256(value.encode("utf-8")).digest())
+
+    return key_hash.hexdigest()
+
+
+def _get_cache_fname(cache_dir, key):
+    """Get the cache filename corresponding to the given key.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory.
+    key : str
+        Cache key.
+
+    Returns
+    -------
+    str
+        Cache filename.
+    """
+
+    return os.path.join(cache_dir, key + cache_extension)
+
+
+def load_cached_match(cache_dir, key):
+    """Load the contributor to project matching data stored for the given
+    key. A hit marks the entry as the most recently used one.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory.
+    key : str
+        Cache key.
+
+    Returns
+    -------
+    match_df : DataFrame or None
+        Contributor to project matching data; None if the key is not cached.
+    """
+
+    fname = _get_cache_fname(cache_dir, key)
+
+    if not os.path.isfile(fname):
+        return None
+
+    # The default float parser does not restore the exact stored scores, and
+    # scores differing by a single ulp would be ranked differently
+    match_df = pd.read_csv(fname, float_precision="round_trip")
+
+    # Refresh the modification time so that it tracks the last use
+    os.utime(fname)
+
+    return match_df
+
+
+def evict_cache(cache_dir, max_size=default_cache_max_size):
+    """Evict the least recently used entries from the cache until the total
+    size of the cache is no larger than the given size.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory.
+    max_size : int, optional
+        Maximum cache size (bytes).
+
+    Returns
+    -------
+    evicted : list
+        Evicted cache keys.
+    """
+
+    entries = []
+
+    for basename in os.listdir(cache_dir):
+        if not basename.endswith(cache_extension):
+            continue
+        stat = os.stat(os.path.join(cache_dir, basename))
+        entries.append((stat.st_mtime, stat.st_size, basename))
+
+    # Sort entries from the most to the least recently used
+    entries.sort(reverse=True)
+
+    total_size = sum(size for _, size, _ in entries)
+
+    evicted = []
+
+    while entries and total_size > max_size:
+        _, size, basename = entries.pop()
+        os.remove(os.path.join(cache_dir, basename))
+        total_size -= size
+        evicted.append(basename[:-len(cache_extension)])
+
+    return evicted
+
+
+def store_cached_match(cache_dir, key, match_df,
+                       max_size=default_cache_max_size):
+    """Store the contributor to project matching data for the given key and
+    evict the least recently used entries if the cache exceeds its size.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory.
+    key : str
+        Cache key.
+    match_df : DataFrame
+        Contributor to project matching data.
+    max_size : int, optional
+        Maximum cache size (bytes).
+    """
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fname = _get_cache_fname(cache_dir, key)
+
+    # Write to a temporary file first so that concurrent runs never read a
+    # partially written entry
+    tmp_fname = fname + ".tmp" + str(os.getpid())
+    match_df.to_csv(tmp_fname, index=False)
+    os.replace(tmp_fname, fname)
+
+    evict_cache(cache_dir, max_size)
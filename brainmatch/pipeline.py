@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from brainmatch.brainmatch import reference_engine_name, compute_top_n, match
+
+
+default_chunk_size = 500
+default_queue_size = 4
+
+# Forking a process while the stage threads hold locks may deadlock the
+# scoring processes
+mp_start_method = "spawn"
+
+_end_of_stream = object()
+
+
+def score_contributor_chunk(projects_df, contributors_df, n,
+                            engine=reference_engine_name):
+    """Compute the contributor to project matching and the top-n project rank
+    of a chunk of contributors.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+    contributors_df : DataFrame
+        Contributor data.
+    n : int
+        Rank of the data to be kept.
+    engine : str, optional
+        Name of the matching engine.
+
+    Returns
+    -------
+    match_df : DataFrame
+        Contributor to project matching data.
+    top_match_df : DataFrame
+        Top-n rank contributor matching data.
+    """
+
+    match_df = match(projects_df, contributors_df, engine)
+
+    return match_df, compute_top_n(match_df, n)
+
+
+class _Stage(threading.Thread):
+    """Pipeline stage running in its own thread. Errors are kept so that they
+    can be raised by the thread driving the pipeline.
+
+    Parameters
+    ----------
+    target : callable
+        Stage function.
+    """
+
+    def __init__(self, target):
+
+        super().__init__(daemon=True)
+        self._target_func = target
+        self.error = None
+
+    def run(self):
+
+        try:
+            self._target_func()
+        except BaseException as e:
+            self.error = e
+
+
+def _put(out_queue, item, is_running):
+    """Put an item in a bounded queue as long as its consumer is running.
+
+    Parameters
+    ----------
+    out_queue : Queue
+        Queue.
+    item : object
+        Item.
+    is_running : callable
+        Whether the consumer of the queue is still running.
+
+    Returns
+    -------
+    bool
+        True if the item was put in the queue.
+    """
+
+    while is_running():
+        try:
+            out_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+
+def _cancel_pending(in_queue):
+    """Cancel the scoring of the chunks waiting in the given queue.
+
+    Parameters
+    ----------
+    in_queue : Queue
+        Scoring future queue.
+    """
+
+    while True:
+        try:
+            future = in_queue.get_nowait()
+        except queue.Empty:
+            return
+        if future is not _end_of_stream:
+            future.cancel()
+
+
+def _write_chunks(in_queue, fname, dec_places):
+    """Write the data chunks of the given queue to a csv file.
+
+    Parameters
+    ----------
+    in_queue : Queue
+        Data chunk queue.
+    fname : str
+        Output filename.
+    dec_places : int
+        Decimal places of the written data.
+    """
+
+    header = True
+
+    with open(fname, 'w', newline='') as f:
+        while True:
+            chunk = in_queue.get()
+            if chunk is _end_of_stream:
+                return
+            chunk.round(dec_places).to_csv(f, header=header, index=False)
+            header = False
+
+
+def run_pipeline(projects_df, contributor_chunks, n, out_match_fname,
+                 out_top_match_fname, dec_places=2, max_workers=None,
+                 queue_size=None, engine=reference_engine_name):
+    """Compute the contributor to project matching and the top-n project rank
+    of each chunk of contributors, and write them to csv files. Reading
+    contributor chunks, scoring them and writing each output file run as
+    concurrent stages connected by bounded queues: contributor chunks are read
+    in a thread, scored in a process pool, and each output file is written in
+    its own thread. Scoring processes are spawned rather than forked, so the
+    matching engine needs to be registered when importing its module.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+    contributor_chunks : iterable
+        Contributor data chunks. The chunks are consumed in the reading
+        thread.
+    n : int
+        Rank of the data to be kept.
+    out_match_fname : str
+        Output match filename.
+    out_top_match_fname : str
+        Output top-n match filename.
+    dec_places : int, optional
+        Decimal places of the written data.
+    max_workers : int, optional
+        Number of scoring processes.
+    queue_size : int, optional
+        Maximum number of chunks waiting between two stages. Defaults to
+        twice the number of scoring processes (and at least
+        ``default_queue_size``), so that all the processes are kept busy.
+    engine : str, optional
+        Name of the matching engine.
+
+    Returns
+    -------
+    match_df : DataFrame
+        Contributor to project matching data.
+    """
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # Scoring futures are held in the queue, so it bounds the number of
+    # chunks being scored at once
+    if queue_size is None:
+        queue_size = max(default_queue_size, 2 * max_workers)
+
+    stop = threading.Event()
+
+    score_queue = queue.Queue(maxsize=queue_size)
+    match_queue = queue.Queue(maxsize=queue_size)
+    top_match_queue = queue.Queue(maxsize=queue_size)
+
+    match_chunks = []
+
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(mp_start_method)) \
+            as executor:
+
+        def _read():
+            try:
+                for contributors_df in contributor_chunks:
+                    future = executor.submit(
+                        score_contributor_chunk, projects_df,
+                        contributors_df, n, engine)
+                    if not _put(score_queue, future,
+                                lambda: not stop.is_set()):
+                        future.cancel()
+                        return
+            finally:
+                _put(score_queue, _end_of_stream, lambda: not stop.is_set())
+
+        reader = _Stage(_read)
+        writers = [
+            (match_queue, _Stage(lambda: _write_chunks(
+                match_queue, out_match_fname, dec_places))),
+            (top_match_queue, _Stage(lambda: _write_chunks(
+                top_match_queue, out_top_match_fname, dec_places)))]
+
+        reader.start()
+        for _, writer in writers:
+            writer.start()
+
+        try:
+            # Hand the scored chunks over to the writers in reading order
+            while True:
+                future = score_queue.get()
+                if future is _end_of_stream:
+                    break
+
+                match_df, top_match_df = future.result()
+                match_chunks.append(match_df)
+
+                for (out_queue, writer), chunk in zip(
+                        writers, [match_df, top_match_df]):
+                    if not _put(out_queue, chunk, writer.is_alive):
+                        if writer.error is not None:
+                            raise writer.error
+                        raise RuntimeError(
+                            "The script cannot continue.\n"
+                            "An output file writer stopped unexpectedly.")
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            if stop.is_set():
+                _cancel_pending(score_queue)
+            reader.join()
+            for out_queue, writer in writers:
+                _put(out_queue, _end_of_stream, writer.is_alive)
+                writer.join()
+
+            errors = [stage.error for stage in [reader] + [
+                writer for _, writer in writers] if stage.error is not None]
+
+            # Do not leave partial results behind
+            if stop.is_set() or errors:
+                for fname in [out_match_fname, out_top_match_fname]:
+                    if os.path.isfile(fname):
+                        os.remove(fname)
+
+    if errors:
+        raise errors[0]
+
+    return pd.concat(match_chunks, ignore_index=True)
@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from brainmatch.brainmatch import (
+    label_separator, project_id_field, project_labels_field,
+    email_address_field, experience_git_skills_field,
+    experience_programming_field, git_skills_label, programming_label,
+    get_contributor_git_skills, get_project_git_skills,
+    get_projects_features)
+
+
+team_label = "team"
+
+# A single swap changes the match score sum by at most 2, so any weight above
+# that makes satisfying one more team requirement worth more than the scores
+default_balance_weight = 3.0
+default_candidate_count = 32
+default_iteration_factor = 5
+
+
+def compile_project_requirements(projects_df):
+    """Compile the team requirements of the projects: the required git skill
+    level and the required programming languages.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+
+    Returns
+    -------
+    git_skills : ndarray
+        Required git skill level of each project; -1 if the project does not
+        require any git skill.
+    programming : list
+        Required programming languages of each project.
+    """
+
+    git_skills = []
+    programming = []
+
+    for labels in projects_df[project_labels_field]:
+        proj_features = get_projects_features(labels)
+
+        # Only the most demanding git skill label is taken into account, as
+        # when scoring
+        git_skills.append(
+            get_project_git_skills(proj_features[git_skills_label]))
+        programming.append(sorted(set(proj_features[programming_label])))
+
+    return np.array(git_skills), programming
+
+
+def compile_contributor_profiles(contributors_df):
+    """Compile the contributor profiles relevant to team formation: the git
+    skill level and the programming languages the contributor has experience
+    in.
+
+    Parameters
+    ----------
+    contributors_df : DataFrame
+        Contributor data.
+
+    Returns
+    -------
+    git_skills : ndarray
+        Git skill level of each contributor.
+    programming : list
+        Programming languages of each contributor.
+    """
+
+    git_skills = np.array(
+        [get_contributor_git_skills(data)
+         for data in contributors_df[experience_git_skills_field]])
+
+    programming = [
+        set(s.strip() for s in data.split(label_separator))
+        for data in contributors_df[experience_programming_field].fillna("")]
+
+    return git_skills, programming
+
+
+def _compute_team_sizes(contributor_count, project_count):
+    """Compute the team sizes so that contributors are evenly spread across
+    the projects.
+
+    Parameters
+    ----------
+    contributor_count : int
+        Contributor count.
+    project_count : int
+        Project count.
+
+    Returns
+    -------
+    ndarray
+        Team size of each project.
+    """
+
+    sizes = np.full(project_count, contributor_count // project_count)
+    sizes[:contributor_count % project_count] += 1
+
+    return sizes
+
+
+class _TeamState:
+    """Team assignment together with the per-team aggregates required to
+    evaluate swap moves incrementally.
+
+    Parameters
+    ----------
+    scores : ndarray
+        Contributor to project match scores (contributors x projects).
+    meets_git : ndarray
+        Whether each contributor meets the git skill level of each project
+        (contributors x projects).
+    requires_git : ndarray
+        Whether each project requires any git skill.
+    programming : ndarray
+        Programming languages of each contributor (contributors x languages).
+    required_programming : ndarray
+        Programming languages required by each project (projects x
+        languages).
+    balance_weight : float
+        Weight of the team requirements with respect to the match scores.
+    """
+
+    def __init__(self, scores, meets_git, requires_git, programming,
+                 required_programming, balance_weight):
+
+        self.scores = scores
+        self.meets_git = meets_git
+        self.requires_git = requires_git
+        self.programming = programming
+        self.required_programming = required_programming
+        self.balance_weight = balance_weight
+
+        project_count = scores.shape[1]
+        self.required_count = np.maximum(required_programming.sum(axis=1), 1)
+
+        self.teams = np.full(scores.shape[0], -1)
+        self.git_count = np.zeros(project_count, dtype=int)
+        self.programming_count = np.zeros(
+            (project_count, programming.shape[1]), dtype=int)
+
+    def assign(self, contrib, team):
+
+        self.teams[contrib] = team
+        self.git_count[team] += self.meets_git[contrib, team]
+        self.programming_count[team] += self.programming[contrib]
+
+    def _balance(self, teams, git_count, programming_count):
+        """Compute the requirement fulfillment of the given teams for the
+        given aggregates."""
+
+        git = np.where(self.requires_git[teams], git_count > 0, 1)
+        covered = ((programming_count > 0) &
+                   self.required_programming[teams]).sum(axis=-1)
+
+        return git + covered / self.required_count[teams]
+
+    def swap_deltas(self, contrib, candidates):
+        """Compute the objective change of swapping the teams of the given
+        contributor and each of the candidates."""
+
+        team = self.teams[contrib]
+        others = self.teams[candidates]
+
+        delta = (self.scores[candidates, team] - self.scores[contrib, team] +
+                 self.scores[contrib, others] -
+                 self.scores[candidates, others])
+
+        git_count = (self.git_count[team] - self.meets_git[contrib, team] +
+                     self.meets_git[candidates, team])
+        programming_count = (self.programming_count[team] -
+                             self.programming[contrib] +
+                             self.programming[candidates])
+        delta_team = self._balance(
+            np.full(len(candidates), team), git_count, programming_count)
+        delta_team -= self._balance(
+            team, self.git_count[team], self.programming_count[team])
+
+        git_count = (self.git_count[others] -
+                     self.meets_git[candidates, others] +
+                     self.meets_git[contrib, others])
+        programming_count = (self.programming_count[others] -
+                             self.programming[candidates] +
+                             self.programming[contrib])
+        delta_others = self._balance(others, git_count, programming_count)
+        delta_others -= self._balance(
+            others, self.git_count[others], self.programming_count[others])
+
+        return delta + self.balance_weight * (delta_team + delta_others)
+
+    def swap(self, contrib, candidate):
+
+        team = self.teams[contrib]
+        other = self.teams[candidate]
+
+        for member, old, new in [(contrib, team, other),
+                                 (candidate, other, team)]:
+            self.git_count[old] -= self.meets_git[member, old]
+            self.programming_count[old] -= self.programming[member]
+            self.assign(member, new)
+
+
+def _seed_teams(state, sizes):
+    """Greedily seed the teams: first give each project requiring git skills
+    its best scoring contributor meeting the required level, and then fill
+    the remaining places by decreasing match score.
+
+    Parameters
+    ----------
+    state : _TeamState
+        Team state.
+    sizes : ndarray
+        Team size of each project.
+    """
+
+    free = sizes.copy()
+
+    # Start with the projects having the fewest eligible contributors
+    eligible = state.meets_git.sum(axis=0)
+    for team in np.argsort(eligible, kind="stable"):
+        if not state.requires_git[team] or not free[team]:
+            continue
+        candidates = np.flatnonzero(
+            state.meets_git[:, team] & (state.teams < 0))
+        if len(candidates):
+            best = candidates[np.argmax(state.scores[candidates, team])]
+            state.assign(best, team)
+            free[team] -= 1
+
+    order = np.argsort(-state.scores, axis=None, kind="stable")
+    for contrib, team in zip(*np.unravel_index(order, state.scores.shape)):
+        if state.teams[contrib] < 0 and free[team]:
+            state.assign(contrib, team)
+            free[team] -= 1
+
+
+def build_teams(projects_df, contributors_df, match_df,
+                balance_weight=default_balance_weight, n_iter=None,
+                n_candidates=default_candidate_count, random_state=None):
+    """Build balanced project teams. Contributors are spread evenly across
+    the projects so that the sum of the contributor match scores is high,
+    while each team has at least one contributor whose git skill level is at
+    or above the project's level and covers the programming languages
+    required by the project.
+
+    Teams are greedily seeded, and then improved by a local search that swaps
+    contributors between teams. Swap moves are evaluated incrementally from
+    per-team aggregates.
+
+    Parameters
+    ----------
+    projects_df : DataFrame
+        Project data.
+    contributors_df : DataFrame
+        Contributor data.
+    match_df : DataFrame
+        Contributor to project matching data.
+    balance_weight : float, optional
+        Weight of the team requirements with respect to the match scores.
+    n_iter : int, optional
+        Local search iteration count. Defaults to a multiple of the
+        contributor count.
+    n_candidates : int, optional
+        Number of swap candidates evaluated at each iteration.
+    random_state : int, optional
+        Seed of the random number generator.
+
+    Returns
+    -------
+    teams_df : DataFrame
+        Project team of each contributor.
+    """
+
+    project_ids = list(map(str, projects_df[project_id_field].tolist()))
+    scores = match_df[project_ids].to_numpy(dtype=float)
+
+    proj_git_skills, proj_programming = \
+        compile_project_requirements(projects_df)
+    contrib_git_skills, contrib_programming = \
+        compile_contributor_profiles(contributors_df)
+
+    # Only the required programming languages are relevant to the coverage
+    languages = sorted(set().union(*proj_programming))
+    required_programming = np.array(
+        [[lang in programming for lang in languages]
+         for programming in proj_programming], dtype=bool).reshape(
+        len(project_ids), len(languages))
+    programming = np.array(
+        [[lang in programming for lang in languages]
+         for programming in contrib_programming], dtype=int).reshape(
+        len(contributors_df), len(languages))
+
+    requires_git = proj_git_skills > 0
+    meets_git = (contrib_git_skills[:, None] >= proj_git_skills[None, :]) & \
+        requires_git[None, :]
+
+    state = _TeamState(scores, meets_git.astype(int), requires_git,
+                       programming, required_programming, balance_weight)
+
+    contributor_count = len(contributors_df)
+    sizes = _compute_team_sizes(contributor_count, len(project_ids))
+    _seed_teams(state, sizes)
+
+    if n_iter is None:
+        n_iter = default_iteration_factor * contributor_count
+
+    rng = np.random.default_rng(random_state)
+
+    if len(project_ids) > 1:
+        for _ in range(n_iter):
+            contrib = rng.integers(contributor_count)
+            candidates = rng.integers(contributor_count, size=n_candidates)
+            candidates = candidates[
+                state.teams[candidates] != state.teams[contrib]]
+            if not len(candidates):
+                continue
+
+            deltas = state.swap_deltas(contrib, candidates)
+            best = np.argmax(deltas)
+            if deltas[best] > 1e-12:
+                state.swap(contrib, candidates[best])
+
+    teams_df = pd.DataFrame({
+        email_address_field: contributors_df[email_address_field].tolist(),
+        team_label: [project_ids[team] for team in state.teams]})
+
+    return teams_df
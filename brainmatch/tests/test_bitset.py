@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from data import read_test_data
+
+from brainmatch.brainmatch import (
+    project_id_field, project_labels_field, match)
+from brainmatch.bitset import (
+    popcount, pack_label_sets, compile_project_label_sets,
+    compile_contributor_label_sets, match_bitset)
+
+
+def test_popcount():
+
+    masks = np.array(
+        [[0, 0], [1, 2 ** 63], [2 ** 64 - 1, 5]], dtype=np.uint64)
+
+    expected_val = [0, 2, 66]
+
+    obtained_val = popcount(masks)
+
+    assert obtained_val.tolist() == expected_val
+
+
+def test_pack_label_sets():
+
+    rows = [0, 0, 1, 1, 1]
+    bits = [0, 64, 3, 3, 70]
+
+    expected_val = np.array(
+        [[1, 1], [8, 64], [0, 0]], dtype=np.uint64)
+
+    obtained_val = pack_label_sets(rows, bits, 3, 71)
+
+    np.testing.assert_array_equal(obtained_val, expected_val)
+
+
+def test_compile_project_label_sets():
+
+    projects_df, _ = read_test_data()
+
+    git_skills, vocabularies, masks, counts, nzero_feature_count = \
+        compile_project_label_sets(projects_df)
+
+    assert git_skills.tolist() == [2, 3, 2]
+    assert vocabularies['programming:'] == {
+        'Python': 0, 'Julia': 1, 'R': 2, 'Bash': 3, 'Matlab': 4, 'C++': 5}
+    assert masks['programming:'][:, 0].tolist() == [7, 24, 32]
+    assert counts['tools:'].tolist() == [2, 4, 1]
+    assert nzero_feature_count.tolist() == [7, 8, 5]
+
+
+def test_compile_contributor_label_sets():
+
+    projects_df, contributors_df = read_test_data()
+
+    _, vocabularies, _, _, _ = compile_project_label_sets(projects_df)
+
+    git_skills, masks = compile_contributor_label_sets(
+        contributors_df, vocabularies)
+
+    assert git_skills.tolist() == [3, 3, 1, 3, 1, 2]
+    # Python, R and Matlab
+    assert masks['experience_programming_field'][0, 0] == 21
+    # Julia and C++
+    assert masks['desired_programming_field'][0, 0] == 34
+
+
+def test_match_bitset():
+
+    projects_df, contributors_df = read_test_data()
+
+    expected_val = match(projects_df, contributors_df)
+
+    obtained_val = match_bitset(projects_df, contributors_df, block_size=4)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    # Test label vocabularies spanning several words
+    tools = ['tool{}'.format(i) for i in range(130)]
+
+    projects_df = pd.DataFrame({
+        project_id_field: [1, 2],
+        project_labels_field: [
+            ', '.join(['tools:' + tool for tool in tools[:100]] +
+                      ['git_skills:1_commit_push']),
+            'tools:tool129, tools:tool129, tools:tool3, '
+            'git_skills:3_continuous_integration']})
+
+    contributors_df = contributors_df[:2].copy()
+    contributors_df['experience_tools_field'] = [
+        'tool99, tool129, tool2', 'tool3, tool64']
+
+    expected_val = match(projects_df, contributors_df)
+
+    obtained_val = match_bitset(projects_df, contributors_df)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
@@ -5,14 +5,19 @@ import json
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from data import TEST_FILES
 
 from brainmatch.brainmatch import (
     project_id_field, project_labels_field,
-    compute_top_n, get_projects_features, compute_feature_score,
-    compute_total_score, match, filter_event_projects,
-    check_necessary_contributor_data, normalize_contributors)
+    compare_top_n, compute_top_n, get_projects_features,
+    get_project_git_skills, get_contributor_git_skills, compute_feature_score,
+    compute_total_score, match, match_reference, filter_event_projects,
+    get_match_engine, register_match_engine, match_engines,
+    check_necessary_contributor_data, normalize_contributors,
+    quarantine_contributor_data, report_invalid_contributor_data,
+    validate_contributor_data)
 
 
 def test_compute_top_n():
@@ -52,6 +57,77 @@ def test_compute_top_n():
     pd.testing.assert_frame_equal(obtained_val, expected_val)
 
 
+def test_compare_top_n():
+
+    columns = [
+        'email_address_field', 'id_top1', 'score_top1', 'id_top2',
+        'score_top2']
+
+    data = [
+        ['participant1@bhg.org', '1', 0.714286, '4', 0.600000],
+        ['participant2@bhg.org', '1', 0.476190, '4', 0.400000],
+        ['participant3@bhg.org', '4', 0.600000, '1', 0.333333],
+        ['participant4@bhg.org', '4', 0.600000, '1', 0.285714]]
+
+    previous_top_match_df = pd.DataFrame(data=data, columns=columns)
+
+    data = [
+        ['participant4@bhg.org', '4', 0.600000, '1', 0.285714],
+        ['participant3@bhg.org', '1', 0.600000, '4', 0.600000],
+        ['participant2@bhg.org', '1', 0.500000, '4', 0.450000],
+        ['participant5@bhg.org', '4', 0.400000, '3', 0.093750]]
+
+    current_top_match_df = pd.DataFrame(data=data, columns=columns)
+
+    data = [
+        ['participant1@bhg.org', '1,4', ''],
+        ['participant3@bhg.org', '4,1', '1,4'],
+        ['participant5@bhg.org', '', '4,3']]
+
+    columns = ['email_address_field', 'previous_projects', 'current_projects']
+
+    expected_val = pd.DataFrame(data=data, columns=columns)
+
+    obtained_val = compare_top_n(previous_top_match_df, current_top_match_df)
+
+    obtained_val = obtained_val.sort_values(
+        'email_address_field').reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_compare_top_n_duplicate_emails():
+
+    columns = [
+        'email_address_field', 'id_top1', 'score_top1', 'id_top2',
+        'score_top2']
+
+    data = [
+        ['participant1@bhg.org', '1', 0.714286, '4', 0.600000],
+        ['participant2@bhg.org', '1', 0.476190, '4', 0.400000],
+        ['participant1@bhg.org', '4', 0.600000, '1', 0.333333]]
+
+    previous_top_match_df = pd.DataFrame(data=data, columns=columns)
+
+    data = [
+        ['participant2@bhg.org', '1', 0.476190, '4', 0.400000],
+        ['participant2@bhg.org', '4', 0.500000, '1', 0.400000],
+        ['participant1@bhg.org', '4', 0.600000, '1', 0.333333]]
+
+    current_top_match_df = pd.DataFrame(data=data, columns=columns)
+
+    # The last row of each contributor is compared
+    data = [['participant2@bhg.org', '1,4', '4,1']]
+
+    columns = ['email_address_field', 'previous_projects', 'current_projects']
+
+    expected_val = pd.DataFrame(data=data, columns=columns)
+
+    obtained_val = compare_top_n(previous_top_match_df, current_top_match_df)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
 def test_get_projects_features():
 
     project_data = \
@@ -70,6 +146,22 @@ def test_get_projects_features():
     assert obtained_val == expected_val
 
 
+def test_get_project_git_skills():
+
+    assert get_project_git_skills([]) == -1
+    assert get_project_git_skills(['2_branches_PRs']) == 2
+    # Labels are sorted as strings
+    assert get_project_git_skills(
+        ['3_continuous_integration', '10_release_management']) == 3
+
+
+def test_get_contributor_git_skills():
+
+    assert get_contributor_git_skills('3 Continuous Integration') == 3
+    assert get_contributor_git_skills('Level 10 Expert') == 10
+    assert get_contributor_git_skills('v2 level 1') == 1
+
+
 def test_compute_feature_score():
 
     proj_feature = ['DWI']
@@ -168,6 +260,28 @@ def test_match():
     pd.testing.assert_frame_equal(obtained_val, expected_val)
 
 
+def test_register_match_engine():
+
+    def _match_constant(projects_df, contributors_df):
+        return pd.DataFrame()
+
+    register_match_engine("constant", _match_constant)
+
+    try:
+        assert get_match_engine("constant") is _match_constant
+        assert match(None, None, "constant").empty
+    finally:
+        del match_engines["constant"]
+
+
+def test_get_match_engine():
+
+    assert get_match_engine("reference") is match_reference
+
+    with pytest.raises(ValueError, match="Unknown matching engine"):
+        get_match_engine("unknown")
+
+
 def test_filter_event_projects():
 
     column_names = [project_id_field, project_labels_field]
@@ -197,6 +311,96 @@ def test_check_necessary_contributor_data():
     check_necessary_contributor_data(contributors_df)
 
 
+def _read_invalid_contributors():
+
+    contributors_df = pd.read_csv(TEST_FILES["participant_registration"])
+
+    with open(TEST_FILES["fields"], 'r') as f:
+        contributor_fields = json.load(f)
+
+    normalize_contributors(contributors_df, contributor_fields)
+
+    contributors_df.loc[1, 'experience_git_skills_field'] = 'Expert'
+    contributors_df.loc[3, 'desired_topic_field'] = float("nan")
+    contributors_df.loc[3, 'experience_git_skills_field'] = ' '
+
+    return contributors_df
+
+
+def test_validate_contributor_data():
+
+    contributors_df = _read_invalid_contributors()
+
+    data = [
+        [2, 'experience_git_skills_field', 'Expert', 'no git skill level'],
+        [4, 'experience_git_skills_field', ' ', 'missing value'],
+        [4, 'desired_topic_field', float("nan"), 'missing value']]
+
+    columns = ['row', 'field', 'value', 'reason']
+
+    expected_val = pd.DataFrame(data=data, columns=columns, index=[1, 3, 3])
+
+    obtained_val = validate_contributor_data(contributors_df)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_validate_contributor_data_numeric():
+
+    contributors_df = _read_invalid_contributors()
+    contributors_df['experience_git_skills_field'] = [3, 2, 1, 3, 1, 2]
+
+    data = [
+        [1, 'experience_git_skills_field', 3, 'missing value'],
+        [2, 'experience_git_skills_field', 2, 'missing value'],
+        [3, 'experience_git_skills_field', 1, 'missing value'],
+        [4, 'experience_git_skills_field', 3, 'missing value'],
+        [4, 'desired_topic_field', float("nan"), 'missing value'],
+        [5, 'experience_git_skills_field', 1, 'missing value'],
+        [6, 'experience_git_skills_field', 2, 'missing value']]
+
+    columns = ['row', 'field', 'value', 'reason']
+
+    expected_val = pd.DataFrame(
+        data=data, columns=columns, index=[0, 1, 2, 3, 3, 4, 5])
+    expected_val['value'] = expected_val['value'].astype(object)
+
+    obtained_val = validate_contributor_data(contributors_df)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_report_invalid_contributor_data():
+
+    contributors_df = pd.read_csv(TEST_FILES["participant_registration"])
+
+    with open(TEST_FILES["fields"], 'r') as f:
+        contributor_fields = json.load(f)
+
+    normalize_contributors(contributors_df, contributor_fields)
+
+    report_invalid_contributor_data(
+        validate_contributor_data(contributors_df))
+
+    with pytest.raises(ValueError, match="Expert"):
+        report_invalid_contributor_data(
+            validate_contributor_data(_read_invalid_contributors()))
+
+
+def test_quarantine_contributor_data():
+
+    contributors_df = _read_invalid_contributors()
+
+    valid_df, quarantined_df = quarantine_contributor_data(contributors_df)
+
+    assert valid_df.index.tolist() == [0, 2, 4, 5]
+    assert quarantined_df.index.tolist() == [1, 3]
+    assert quarantined_df['reason'].tolist() == [
+        'experience_git_skills_field: no git skill level',
+        'experience_git_skills_field: missing value; '
+        'desired_topic_field: missing value']
+
+
 def test_normalize_contributors():
 
     contributors_df = pd.read_csv(TEST_FILES["participant_registration"])
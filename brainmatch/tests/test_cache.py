@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data import TEST_FILES, read_test_data
+
+from brainmatch.brainmatch import match
+from brainmatch.cache import (
+    compute_source_hash, compute_cache_key, evict_cache, load_cached_match,
+    store_cached_match)
+
+
+def _create_match_df():
+
+    data = [
+        ['participant1@bhg.org', 0.7142857142857143, 0.3125],
+        ['participant2@bhg.org', 0.47619047619047616, 0.25]]
+
+    columns = ['email_address_field', '1', '3']
+
+    return pd.DataFrame(data=data, columns=columns)
+
+
+def test_compute_source_hash():
+
+    assert compute_source_hash() == compute_source_hash()
+
+
+def test_compute_cache_key():
+
+    fnames = [TEST_FILES["projects"], TEST_FILES["participant_registration"],
+              TEST_FILES["fields"]]
+
+    key = compute_cache_key(
+        "bhg:boston_usa_1", *fnames, lib_version="0.1", source_hash="a")
+
+    assert key == compute_cache_key(
+        "bhg:boston_usa_1", *fnames, lib_version="0.1", source_hash="a")
+    assert key != compute_cache_key(
+        "bhg:global", *fnames, lib_version="0.1", source_hash="a")
+    assert key != compute_cache_key(
+        "bhg:boston_usa_1", *fnames, lib_version="0.2", source_hash="a")
+    assert key != compute_cache_key(
+        "bhg:boston_usa_1", *fnames, engine="bitset", lib_version="0.1",
+        source_hash="a")
+    # A modified scoring code must result in a different key
+    assert key != compute_cache_key(
+        "bhg:boston_usa_1", *fnames, lib_version="0.1", source_hash="b")
+
+    # Swapping the input files must result in a different key
+    assert key != compute_cache_key(
+        "bhg:boston_usa_1", fnames[1], fnames[0], fnames[2],
+        lib_version="0.1", source_hash="a")
+
+
+def test_load_cached_match():
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        assert load_cached_match(cache_dir, "missing") is None
+
+        expected_val = _create_match_df()
+        store_cached_match(cache_dir, "key", expected_val)
+
+        obtained_val = load_cached_match(cache_dir, "key")
+
+        pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+        # Test that the scores are restored exactly, so that ties are ranked
+        # as in a fresh run
+        projects_df, contributors_df = read_test_data()
+        expected_val = match(projects_df, contributors_df)
+        expected_val["ulp"] = [
+            0.1 + 0.2, 0.3, 1 / 3, np.nextafter(1 / 3, 1), 2 / 7, 5 / 21]
+        store_cached_match(cache_dir, "match", expected_val)
+
+        obtained_val = load_cached_match(cache_dir, "match")
+
+        pd.testing.assert_frame_equal(
+            obtained_val, expected_val, check_exact=True)
+
+
+def test_evict_cache():
+
+    match_df = _create_match_df()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        for i, key in enumerate(["key1", "key2", "key3"]):
+            store_cached_match(cache_dir, key, match_df)
+            fname = os.path.join(cache_dir, key + ".csv")
+            os.utime(fname, (i, i))
+
+        # Mark the oldest entry as the most recently used one
+        os.utime(os.path.join(cache_dir, "key1.csv"), (10, 10))
+
+        entry_size = os.path.getsize(os.path.join(cache_dir, "key1.csv"))
+
+        obtained_val = evict_cache(cache_dir, 2 * entry_size)
+
+        assert obtained_val == ["key2"]
+        assert sorted(os.listdir(cache_dir)) == ["key1.csv", "key3.csv"]
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from brainmatch.brainmatch import (
+    label_separator, project_id_field, project_labels_field,
+    email_address_field, experience_git_skills_field, git_skills_label,
+    modality_label, programming_label, project_type_label,
+    project_tools_skills_label, tools_label, topic_label,
+    reference_engine_name, match_engines, compute_top_n, match)
+
+
+# Small vocabularies so that generated contributors and projects overlap
+vocabularies = {
+    modality_label: ["DWI", "EEG", "fMRI", "MEG", "MRI"],
+    programming_label: ["Bash", "C++", "Julia", "Matlab", "Python", "R"],
+    tools_label: ["AFNI", "ANTs", "DIPY", "FSL", "MNE", "Nipype", "SPM"],
+    topic_label: ["Connectome", "ICA", "PCA", "Tractography"],
+    project_type_label: ["coding_methods", "documentation"],
+    project_tools_skills_label: ["Docker", "Jupyter"],
+}
+
+# Multi-digit levels exercise the string sorting of the git skill labels
+git_skills_labels = [
+    "0_no_skills", "1_commit_push", "2_branches_PRs",
+    "3_continuous_integration", "10_release_management"]
+
+# Labels that no project requires
+unknown_labels = ["Java", "Web", "Freesurfer", "Physiology"]
+
+contributor_fields = {
+    "experience_modality_field": modality_label,
+    "experience_programming_field": programming_label,
+    "experience_tools_field": tools_label,
+    "experience_topic_field": topic_label,
+    "desired_modality_field": modality_label,
+    "desired_programming_field": programming_label,
+    "desired_tools_field": tools_label,
+    "desired_topic_field": topic_label,
+}
+
+tolerance = 1e-9
+
+candidate_engines = sorted(
+    name for name in match_engines if name != reference_engine_name)
+
+
+@st.composite
+def projects(draw):
+
+    project_count = draw(st.integers(min_value=1, max_value=6))
+
+    labels = []
+    for _ in range(project_count):
+        # The reference engine requires at least one git skill label
+        project_labels = [
+            git_skills_label + label for label in draw(st.lists(
+                st.sampled_from(git_skills_labels), min_size=1,
+                max_size=2))]
+        for family, vocabulary in vocabularies.items():
+            # Duplicate labels are allowed
+            project_labels += [family + label for label in draw(st.lists(
+                st.sampled_from(vocabulary), max_size=4))]
+        project_labels = draw(st.permutations(project_labels))
+        labels.append(", ".join(project_labels + ["bhg:global"]))
+
+    return pd.DataFrame({
+        project_id_field: list(range(1, project_count + 1)),
+        project_labels_field: labels})
+
+
+@st.composite
+def contributors(draw):
+
+    contributor_count = draw(st.integers(min_value=1, max_value=8))
+
+    data = {email_address_field: [
+        "participant{}@bhg.org".format(i) for i in range(contributor_count)]}
+
+    data[experience_git_skills_field] = [
+        "{} {}".format(draw(st.integers(min_value=0, max_value=11)),
+                       draw(st.sampled_from(["Commit & Push", "Expert"])))
+        for _ in range(contributor_count)]
+
+    for field, family in contributor_fields.items():
+        values = []
+        for _ in range(contributor_count):
+            labels = draw(st.lists(
+                st.sampled_from(vocabularies[family] + unknown_labels),
+                min_size=1, max_size=5))
+            # Surround labels with irregular whitespaces
+            values.append(label_separator.join(
+                draw(st.sampled_from(["", " ", "  "])) + label
+                for label in labels))
+        data[field] = values
+
+    return pd.DataFrame(data)
+
+
+def _check_top_n(reference_df, top_match_df, n):
+    """Check that the top-n ranks are valid ranks of the reference scores,
+    ties being allowed to be ranked in any order."""
+
+    reference_top_match_df = compute_top_n(reference_df, n)
+    scores = reference_df.set_index(email_address_field)
+
+    for (_, expected), (_, obtained) in zip(
+            reference_top_match_df.iterrows(), top_match_df.iterrows()):
+        assert obtained[email_address_field] == expected[email_address_field]
+        expected_scores = expected[2::2].to_numpy(dtype=float)
+        obtained_scores = scores.loc[
+            obtained[email_address_field],
+            obtained[1::2].tolist()].to_numpy(dtype=float)
+        np.testing.assert_allclose(
+            obtained_scores, expected_scores, rtol=0, atol=tolerance)
+
+
+@pytest.mark.parametrize("engine", candidate_engines)
+@settings(max_examples=50, deadline=None,
+          suppress_health_check=[HealthCheck.too_slow])
+@given(projects_df=projects(), contributors_df=contributors(),
+       n=st.integers(min_value=1, max_value=6))
+def test_engine_equivalence(engine, projects_df, contributors_df, n):
+
+    expected_val = match(projects_df, contributors_df)
+
+    obtained_val = match(projects_df, contributors_df, engine)
+
+    assert obtained_val.columns.tolist() == expected_val.columns.tolist()
+    assert obtained_val[email_address_field].tolist() == \
+        expected_val[email_address_field].tolist()
+
+    pd.testing.assert_frame_equal(
+        obtained_val, expected_val, check_exact=False, rtol=0,
+        atol=tolerance)
+
+    _check_top_n(expected_val, compute_top_n(obtained_val, n), n)
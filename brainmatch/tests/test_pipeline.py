@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from data import TEST_FILES, read_test_data
+
+from brainmatch.brainmatch import compute_top_n, match
+from brainmatch.pipeline import score_contributor_chunk, run_pipeline
+
+
+def test_score_contributor_chunk():
+
+    projects_df, contributors_df = read_test_data()
+
+    match_df, top_match_df = score_contributor_chunk(
+        projects_df, contributors_df[2:4], 2)
+
+    expected_val = match(projects_df, contributors_df[2:4])
+
+    pd.testing.assert_frame_equal(match_df, expected_val)
+
+    expected_val = compute_top_n(expected_val, 2)
+
+    pd.testing.assert_frame_equal(top_match_df, expected_val)
+
+
+def test_run_pipeline():
+
+    projects_df, contributors_df = read_test_data()
+
+    chunks = [contributors_df[i:i+2] for i in range(0, 6, 2)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        out_match_fname = os.path.join(tmp_dir, "match.csv")
+        out_top_match_fname = os.path.join(tmp_dir, "match_top.csv")
+
+        obtained_val = run_pipeline(
+            projects_df, iter(chunks), 2, out_match_fname,
+            out_top_match_fname, max_workers=2, queue_size=1)
+
+        expected_val = match(projects_df, contributors_df)
+
+        pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+        expected_val = pd.read_csv(TEST_FILES["expected_match_global"])
+        obtained_val = pd.read_csv(out_match_fname)
+
+        pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+        expected_val = pd.read_csv(TEST_FILES["expected_match_global_top"])
+        obtained_val = pd.read_csv(out_top_match_fname)
+
+        pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+        # Test that reading errors are raised and no partial result is left
+        def _read_chunks():
+            yield chunks[0]
+            raise ValueError("Invalid chunk")
+
+        with pytest.raises(ValueError, match="Invalid chunk"):
+            run_pipeline(
+                projects_df, _read_chunks(), 2, out_match_fname,
+                out_top_match_fname, max_workers=2)
+
+        assert not os.path.exists(out_match_fname)
+        assert not os.path.exists(out_top_match_fname)
+
+        # Test that writing errors are raised
+        missing_fname = os.path.join(tmp_dir, "missing", "match.csv")
+
+        with pytest.raises(FileNotFoundError):
+            run_pipeline(
+                projects_df, iter(chunks), 2, missing_fname,
+                out_top_match_fname, max_workers=2, queue_size=1)
+
+        assert not os.path.exists(out_top_match_fname)
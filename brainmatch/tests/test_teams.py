@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from data import read_test_data
+
+from brainmatch.brainmatch import (
+    project_id_field, project_labels_field, email_address_field, match)
+from brainmatch.teams import (
+    team_label, _TeamState, compile_contributor_profiles,
+    compile_project_requirements, build_teams)
+
+
+def test_compile_project_requirements():
+
+    projects_df, _ = read_test_data("bhg:global")
+
+    git_skills, programming = compile_project_requirements(projects_df)
+
+    assert git_skills.tolist() == [2, 3, 2]
+    assert programming == [
+        ['Julia', 'Python', 'R'], ['Bash', 'Matlab'], ['C++']]
+
+    # The required git skill level is the one used when scoring
+    projects_df = pd.DataFrame({
+        project_id_field: [1],
+        project_labels_field: [
+            'git_skills:3_continuous_integration, '
+            'git_skills:10_release_management, bhg:global']})
+
+    git_skills, _ = compile_project_requirements(projects_df)
+
+    assert git_skills.tolist() == [3]
+
+
+def test_compile_contributor_profiles():
+
+    _, contributors_df = read_test_data("bhg:global")
+
+    git_skills, programming = compile_contributor_profiles(contributors_df)
+
+    assert git_skills.tolist() == [3, 3, 1, 3, 1, 2]
+    assert programming[2] == {'Python', 'Matlab', 'Java', 'R'}
+    assert programming[4] == {'Matlab'}
+
+
+def test_team_state_swap_deltas():
+
+    rng = np.random.default_rng(1234)
+
+    contributor_count = 20
+    project_count = 4
+    language_count = 5
+
+    scores = rng.random((contributor_count, project_count))
+    meets_git = rng.integers(2, size=(contributor_count, project_count))
+    requires_git = np.array([True, True, False, True])
+    meets_git[:, ~requires_git] = 0
+    programming = rng.integers(2, size=(contributor_count, language_count))
+    required_programming = \
+        rng.integers(2, size=(project_count, language_count)).astype(bool)
+
+    state = _TeamState(scores, meets_git, requires_git, programming,
+                       required_programming, 3.0)
+    for contrib in range(contributor_count):
+        state.assign(contrib, contrib % project_count)
+
+    def _objective(teams):
+        new_state = _TeamState(scores, meets_git, requires_git, programming,
+                               required_programming, 3.0)
+        for contrib, team in enumerate(teams):
+            new_state.assign(contrib, team)
+        balance = new_state._balance(
+            np.arange(project_count), new_state.git_count,
+            new_state.programming_count)
+        return scores[np.arange(contributor_count), teams].sum() + \
+            3.0 * balance.sum()
+
+    # Check the incremental deltas against a full recomputation
+    for contrib in range(contributor_count):
+        candidates = np.flatnonzero(state.teams != state.teams[contrib])
+        deltas = state.swap_deltas(contrib, candidates)
+
+        for candidate, delta in zip(candidates, deltas):
+            teams = state.teams.copy()
+            teams[[contrib, candidate]] = teams[[candidate, contrib]]
+            assert np.isclose(
+                delta, _objective(teams) - _objective(state.teams))
+
+        state.swap(contrib, candidates[np.argmax(deltas)])
+
+
+def test_build_teams():
+
+    projects_df, contributors_df = read_test_data("bhg:global")
+    match_df = match(projects_df, contributors_df)
+
+    teams_df = build_teams(
+        projects_df, contributors_df, match_df, random_state=1234)
+
+    assert teams_df[email_address_field].tolist() == \
+        contributors_df[email_address_field].tolist()
+    assert sorted(teams_df[team_label].value_counts().tolist()) == [2, 2, 2]
+
+    # Each team must have a contributor meeting the project git skill level
+    git_skills, _ = compile_contributor_profiles(contributors_df)
+    proj_git_skills, _ = compile_project_requirements(projects_df)
+    project_ids = list(map(str, projects_df[project_id_field].tolist()))
+    for project_id, proj_git_skill in zip(project_ids, proj_git_skills):
+        members = (teams_df[team_label] == project_id).to_numpy()
+        assert (git_skills[members] >= proj_git_skill).any()
@@ -1,7 +1,14 @@
 """Read test or example data."""
 
+import json
 from os.path import join as pjoin, dirname
 
+import pandas as pd
+
+from brainmatch.brainmatch import (
+    project_id_field, project_labels_field, filter_event_projects,
+    normalize_contributors)
+
 
 DATA_DIR = pjoin(dirname(__file__))
 
@@ -16,3 +23,35 @@ TEST_FILES = {
         DATA_DIR, "participant_registration.csv"),
     "projects": pjoin(DATA_DIR, "projects.tsv"),
 }
+
+
+def read_test_data(event="bhg:global"):
+    """Read the test projects of the given event and the normalized test
+    contributors.
+
+    Parameters
+    ----------
+    event : str, optional
+        BHG event label.
+
+    Returns
+    -------
+    projects_df : DataFrame
+        Project data.
+    contributors_df : DataFrame
+        Contributor data.
+    """
+
+    column_names = [project_id_field, project_labels_field]
+    projects_df = pd.read_csv(
+        TEST_FILES["projects"], sep='\t', header=None, names=column_names,
+        skiprows=1)
+    projects_df = filter_event_projects(event, projects_df)
+
+    contributors_df = pd.read_csv(TEST_FILES["participant_registration"])
+    with open(TEST_FILES["fields"], 'r') as f:
+        contributor_fields = json.load(f)
+
+    normalize_contributors(contributors_df, contributor_fields)
+
+    return projects_df, contributors_df
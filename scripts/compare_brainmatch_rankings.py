@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+
+import pandas as pd
+
+from brainmatch.brainmatch import compare_top_n
+
+
+def _build_arg_parser():
+
+    parser = argparse.ArgumentParser(
+        description="Compare the top-n project-contributor matches of two "
+                    "runs and keep the contributors whose matches changed",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("in_previous_top_match_fname", type=str,
+                        help="Input previous top match filename (.csv).")
+    parser.add_argument("in_current_top_match_fname", type=str,
+                        help="Input current top match filename (.csv).")
+    parser.add_argument("out_diff_fname", type=str,
+                        help="Output changed match filename (.csv)")
+
+    return parser
+
+
+def main():
+
+    # Parse arguments
+    parser = _build_arg_parser()
+    args = parser.parse_args()
+
+    previous_top_match_df = pd.read_csv(args.in_previous_top_match_fname)
+    current_top_match_df = pd.read_csv(args.in_current_top_match_fname)
+
+    # Compare the top n
+    diff_df = compare_top_n(previous_top_match_df, current_top_match_df)
+
+    # Save data to a csv file
+    diff_df.to_csv(args.out_diff_fname, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,15 @@ import pandas as pd
 
 from brainmatch.brainmatch import (
     top_match_label, underscore, project_id_field, project_labels_field,
+    reference_engine_name, match_engines,
     check_necessary_contributor_data, compute_top_n, filter_event_projects,
-    match, normalize_contributors)
+    match, normalize_contributors, quarantine_contributor_data,
+    report_invalid_contributor_data, validate_contributor_data)
+from brainmatch.pipeline import default_chunk_size, run_pipeline
+from brainmatch.teams import team_label, build_teams
+from brainmatch.cache import (
+    default_cache_dir, default_cache_max_size, compute_cache_key,
+    load_cached_match, store_cached_match)
 
 
 extension_sep = "."
@@ -33,24 +40,51 @@ def _build_arg_parser():
                         help="Output match filename (.csv)")
     parser.add_argument("--n", type=int, default=5,
                         help="Top n.")
+    parser.add_argument("--engine", type=str, default=reference_engine_name,
+                        choices=sorted(match_engines),
+                        help="Matching engine.")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of scoring processes. If larger than "
+                             "1, contributor chunks are read, scored and "
+                             "written concurrently.")
+    parser.add_argument("--chunk_size", type=int, default=default_chunk_size,
+                        help="Number of contributors per chunk when scoring "
+                             "concurrently.")
+    parser.add_argument("--quarantine_fname", type=str,
+                        help="Output filename (.csv) where contributors with "
+                             "invalid data are written instead of stopping.")
+    parser.add_argument("--teams", action="store_true",
+                        help="Additionally build balanced project teams.")
+    parser.add_argument("--cache_dir", type=str, default=default_cache_dir,
+                        help="Directory where score matrices are cached.")
+    parser.add_argument("--cache_max_size", type=int,
+                        default=default_cache_max_size,
+                        help="Maximum cache size (bytes).")
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true",
+                        help="Do not use or update the score matrix cache.")
 
     return parser
 
 
-def main():
-
-    # Parse arguments
-    parser = _build_arg_parser()
-    args = parser.parse_args()
+def _read_projects(args):
 
     column_names = [project_id_field, project_labels_field]
     projects_df = pd.read_csv(
         args.in_projects_fname, sep='\t', header=None, names=column_names,
         skiprows=1)
-    contributors_df = pd.read_csv(args.in_contributors_fname)
+
+    # Filter projects not belonging to the event
+    return filter_event_projects(args.bhg_event, projects_df)
+
+
+def _read_contributor_fields(args):
 
     with open(args.in_contributors_fields_fname, 'r') as f:
-        contributor_fields = json.load(f)
+        return json.load(f)
+
+
+def _prepare_contributors(args, contributors_df, contributor_fields,
+                          first_row=1):
 
     # Normalize contributor data
     normalize_contributors(contributors_df, contributor_fields)
@@ -58,18 +92,76 @@ def main():
     # Check the contributor file contains all necessary fields
     check_necessary_contributor_data(contributors_df)
 
-    # Filter projects not belonging to the event
-    projects_df = filter_event_projects(args.bhg_event, projects_df)
+    # Check the contributor data values before scoring
+    quarantined_df = None
+    invalid_df = None
+    if args.quarantine_fname:
+        contributors_df, quarantined_df = \
+            quarantine_contributor_data(contributors_df)
+    else:
+        invalid_df = validate_contributor_data(contributors_df, first_row)
 
-    # Compute the project-contributor match
-    match_df = match(projects_df, contributors_df)
+    return contributors_df, quarantined_df, invalid_df
 
-    # Save data to a csv file
-    dec_places = 2
-    match_df.round(dec_places).to_csv(args.out_match_fname, index=False)
 
-    # Compute the top n
-    top_match_df = compute_top_n(match_df, args.n)
+def _read_inputs(args):
+
+    projects_df = _read_projects(args)
+    contributors_df = pd.read_csv(args.in_contributors_fname)
+    contributor_fields = _read_contributor_fields(args)
+
+    contributors_df, quarantined_df, invalid_df = _prepare_contributors(
+        args, contributors_df, contributor_fields)
+
+    if invalid_df is not None:
+        report_invalid_contributor_data(invalid_df)
+
+    quarantined_count = 0
+    if quarantined_df is not None:
+        quarantined_df.to_csv(args.quarantine_fname, index=False)
+        quarantined_count = len(quarantined_df)
+
+    return projects_df, contributors_df, quarantined_count
+
+
+def _read_contributor_chunks(args, quarantined_counts):
+
+    contributor_fields = _read_contributor_fields(args)
+
+    invalid = []
+
+    first_row = 1
+    for contributors_df in pd.read_csv(
+            args.in_contributors_fname, chunksize=args.chunk_size):
+        chunk_size = len(contributors_df)
+
+        contributors_df, quarantined_df, invalid_df = _prepare_contributors(
+            args, contributors_df, contributor_fields, first_row)
+
+        if quarantined_df is not None:
+            quarantined_df.to_csv(
+                args.quarantine_fname, mode='w' if first_row == 1 else 'a',
+                header=first_row == 1, index=False)
+            quarantined_counts.append(len(quarantined_df))
+
+        first_row += chunk_size
+
+        # Keep validating the remaining chunks so that all invalid values are
+        # reported at once, but stop scoring once any of them is found
+        if invalid_df is not None and not invalid_df.empty:
+            invalid.append(invalid_df)
+        if not invalid:
+            yield contributors_df
+
+    if invalid:
+        report_invalid_contributor_data(pd.concat(invalid))
+
+
+def main():
+
+    # Parse arguments
+    parser = _build_arg_parser()
+    args = parser.parse_args()
 
     path = os.path.dirname(args.out_match_fname)
     match_basename = os.path.basename(args.out_match_fname)
@@ -78,8 +170,68 @@ def main():
         rootname + underscore + top_match_label + extension_sep + ext
     top_fname = os.path.join(path, top_basename)
 
-    # Save data to a csv file
-    top_match_df.round(dec_places).to_csv(top_fname, index=False)
+    dec_places = 2
+
+    cache_key = None
+    match_df = None
+
+    # Reuse the score matrix of a previous run on identical inputs
+    if not args.no_cache:
+        cache_key = compute_cache_key(
+            args.bhg_event, args.in_projects_fname, args.in_contributors_fname,
+            args.in_contributors_fields_fname, args.engine)
+        match_df = load_cached_match(args.cache_dir, cache_key)
+
+    is_cached = match_df is not None
+    contributors_df = None
+    quarantined_count = 0
+
+    if not is_cached and args.jobs > 1:
+        # Read, score and save contributor chunks concurrently
+        quarantined_counts = []
+        match_df = run_pipeline(
+            _read_projects(args),
+            _read_contributor_chunks(args, quarantined_counts), args.n,
+            args.out_match_fname, top_fname, dec_places, args.jobs,
+            engine=args.engine)
+        quarantined_count = sum(quarantined_counts)
+    else:
+        if not is_cached or args.teams or args.quarantine_fname:
+            projects_df, contributors_df, quarantined_count = \
+                _read_inputs(args)
+
+        if not is_cached:
+            # Compute the project-contributor match
+            match_df = match(projects_df, contributors_df, args.engine)
+
+        # Save data to a csv file
+        match_df.round(dec_places).to_csv(args.out_match_fname, index=False)
+
+        # Compute the top n
+        top_match_df = compute_top_n(match_df, args.n)
+
+        # Save data to a csv file
+        top_match_df.round(dec_places).to_csv(top_fname, index=False)
+
+    # Scores of partially valid inputs are not cached so that runs not
+    # quarantining contributors never reuse them
+    if not is_cached and cache_key is not None and not quarantined_count:
+        store_cached_match(
+            args.cache_dir, cache_key, match_df, args.cache_max_size)
+
+    if args.teams:
+        if contributors_df is None:
+            projects_df, contributors_df, _ = _read_inputs(args)
+
+        # Build the project teams
+        teams_df = build_teams(projects_df, contributors_df, match_df)
+
+        teams_basename = \
+            rootname + underscore + team_label + "s" + extension_sep + ext
+        teams_fname = os.path.join(path, teams_basename)
+
+        # Save data to a csv file
+        teams_df.to_csv(teams_fname, index=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import pandas as pd
+
+from data import TEST_FILES
+
+tmp_dir = tempfile.TemporaryDirectory()
+
+
+def test_display_help(script_runner):
+
+    ret = script_runner.run("compare_brainmatch_rankings.py",
+                            "--help")
+    assert ret.success
+
+
+def test_execution(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_previous_top_match_fname = TEST_FILES["expected_match_top"]
+    in_current_top_match_fname = TEST_FILES["expected_match_global_top"]
+
+    out_diff_fname = os.path.join(".", "brainmatch_scores_top_diff.csv")
+
+    ret = script_runner.run(
+        "compare_brainmatch_rankings.py",
+        in_previous_top_match_fname,
+        in_current_top_match_fname,
+        out_diff_fname)
+
+    assert ret.success
+
+    data = [
+        ['participant1@bhg.org', '1,3', '1,4'],
+        ['participant2@bhg.org', '1,3', '1,4'],
+        ['participant3@bhg.org', '1,3', '4,1'],
+        ['participant4@bhg.org', '1,3', '4,1'],
+        ['participant5@bhg.org', '3,1', '4,3'],
+        ['participant6@bhg.org', '1,3', '1,4']]
+
+    columns = ['email_address_field', 'previous_projects', 'current_projects']
+
+    expected_val = pd.DataFrame(data=data, columns=columns)
+    obtained_val = pd.read_csv(out_diff_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    # Test that identical runs do not have any change
+    ret = script_runner.run(
+        "compare_brainmatch_rankings.py",
+        in_previous_top_match_fname,
+        in_previous_top_match_fname,
+        out_diff_fname)
+
+    assert ret.success
+
+    obtained_val = pd.read_csv(out_diff_fname)
+
+    assert obtained_val.empty
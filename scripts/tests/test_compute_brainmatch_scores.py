@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import tempfile
 
 import pandas as pd
@@ -41,7 +42,8 @@ def test_execution(script_runner):
         in_projects_fname,
         in_contributors_fname,
         in_contributors_fields_fname,
-        out_match_fname)
+        out_match_fname,
+        "--no-cache")
 
     assert ret.success
 
@@ -58,7 +60,8 @@ def test_execution(script_runner):
         in_contributors_fname,
         in_contributors_fields_fname,
         out_match_fname,
-        "--n", "2")
+        "--n", "2",
+        "--no-cache")
 
     assert ret.success
 
@@ -78,7 +81,8 @@ def test_execution(script_runner):
         in_projects_fname,
         in_contributors_fname,
         in_contributors_fields_fname,
-        out_match_fname)
+        out_match_fname,
+        "--no-cache")
 
     assert ret.success
 
@@ -95,7 +99,8 @@ def test_execution(script_runner):
         in_contributors_fname,
         in_contributors_fields_fname,
         out_match_fname,
-        "--n", "2")
+        "--n", "2",
+        "--no-cache")
 
     assert ret.success
 
@@ -103,3 +108,305 @@ def test_execution(script_runner):
     obtained_val = pd.read_csv(out_top_match_fname)
 
     pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_execution_cache(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_projects_fname = TEST_FILES["projects"]
+    in_contributors_fname = TEST_FILES["participant_registration"]
+    in_contributors_fields_fname = TEST_FILES["fields"]
+
+    out_match_fname = os.path.join(".", "brainmatch_scores_cache.csv")
+    out_top_match_fname = os.path.join(".", "brainmatch_scores_cache_top.csv")
+
+    cache_dir = os.path.join(tmp_dir.name, "cache")
+    no_cache_dir = os.path.join(tmp_dir.name, "no_cache")
+
+    # Test that bypassing the cache does not store any data
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--cache_dir", no_cache_dir,
+        "--no-cache")
+
+    assert ret.success
+    assert not os.path.exists(no_cache_dir)
+
+    # Test that the first run populates the cache
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--cache_dir", cache_dir)
+
+    assert ret.success
+    assert len(os.listdir(cache_dir)) == 1
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match"])
+    obtained_val = pd.read_csv(out_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    # Test that the top rank results are obtained from the cached scores
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--n", "2",
+        "--cache_dir", cache_dir)
+
+    assert ret.success
+    assert len(os.listdir(cache_dir)) == 1
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match_top"])
+    obtained_val = pd.read_csv(out_top_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_execution_teams(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_projects_fname = TEST_FILES["projects"]
+    in_contributors_fname = TEST_FILES["participant_registration"]
+    in_contributors_fields_fname = TEST_FILES["fields"]
+
+    out_match_fname = os.path.join(".", "brainmatch_scores_teams.csv")
+    out_teams_fname = os.path.join(".", "brainmatch_scores_teams_teams.csv")
+
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:global",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--teams",
+        "--no-cache")
+
+    assert ret.success
+
+    obtained_val = pd.read_csv(out_teams_fname)
+
+    assert obtained_val.columns.tolist() == ["email_address_field", "team"]
+    assert sorted(obtained_val["team"].value_counts().tolist()) == [2, 2, 2]
+
+
+def test_execution_quarantine(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_projects_fname = TEST_FILES["projects"]
+    in_contributors_fields_fname = TEST_FILES["fields"]
+
+    # Create a contributor file with an invalid git skill level
+    in_contributors_fname = os.path.join(".", "invalid_registration.csv")
+    contributors_df = pd.read_csv(TEST_FILES["participant_registration"])
+    contributors_df.loc[1, "My experience with Git is..."] = "Expert"
+    contributors_df.to_csv(in_contributors_fname, index=False)
+
+    out_match_fname = os.path.join(".", "brainmatch_scores_quarantine.csv")
+    quarantine_fname = os.path.join(".", "quarantine.csv")
+
+    # Test that invalid data stop the script
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--no-cache")
+
+    assert not ret.success
+    assert "Expert" in ret.stderr
+
+    # Test that invalid data are quarantined
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--quarantine_fname", quarantine_fname,
+        "--no-cache")
+
+    assert ret.success
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match"]).drop(index=1)
+    obtained_val = pd.read_csv(out_match_fname)
+
+    pd.testing.assert_frame_equal(
+        obtained_val, expected_val.reset_index(drop=True))
+
+    obtained_val = pd.read_csv(quarantine_fname)
+
+    assert obtained_val["email_address_field"].tolist() == \
+        ["participant2@bhg.org"]
+
+    # Test that invalid data are reported with their row number when scoring
+    # contributor chunks concurrently
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--jobs", "2",
+        "--chunk_size", "1",
+        "--no-cache")
+
+    assert not ret.success
+    assert "   2 experience_git_skills_field Expert" in ret.stderr
+
+    # Test that invalid data of all chunks are reported at once
+    in_contributors_chunks_fname = os.path.join(
+        ".", "invalid_registration_chunks.csv")
+    contributors_df.loc[4, "My experience with Git is..."] = "Beginner"
+    contributors_df.to_csv(in_contributors_chunks_fname, index=False)
+
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_chunks_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--jobs", "2",
+        "--chunk_size", "2",
+        "--no-cache")
+
+    assert not ret.success
+    assert re.search(r"2 experience_git_skills_field +Expert", ret.stderr)
+    assert re.search(r"5 experience_git_skills_field Beginner", ret.stderr)
+    assert not os.path.isfile(out_match_fname)
+
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:boston_usa_1",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--quarantine_fname", quarantine_fname,
+        "--jobs", "2",
+        "--chunk_size", "1",
+        "--no-cache")
+
+    assert ret.success
+
+    obtained_val = pd.read_csv(out_match_fname)
+
+    pd.testing.assert_frame_equal(
+        obtained_val, expected_val.reset_index(drop=True))
+
+    obtained_val = pd.read_csv(quarantine_fname)
+
+    assert obtained_val["email_address_field"].tolist() == \
+        ["participant2@bhg.org"]
+
+
+def test_execution_pipeline(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_projects_fname = TEST_FILES["projects"]
+    in_contributors_fname = TEST_FILES["participant_registration"]
+    in_contributors_fields_fname = TEST_FILES["fields"]
+
+    out_match_fname = os.path.join(".", "brainmatch_scores_pipeline.csv")
+    out_top_match_fname = os.path.join(
+        ".", "brainmatch_scores_pipeline_top.csv")
+
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:global",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--n", "2",
+        "--jobs", "2",
+        "--chunk_size", "4",
+        "--no-cache")
+
+    assert ret.success
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match_global"])
+    obtained_val = pd.read_csv(out_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match_global_top"])
+    obtained_val = pd.read_csv(out_top_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+
+def test_execution_engine(script_runner):
+
+    os.chdir(os.path.expanduser(tmp_dir.name))
+
+    in_projects_fname = TEST_FILES["projects"]
+    in_contributors_fname = TEST_FILES["participant_registration"]
+    in_contributors_fields_fname = TEST_FILES["fields"]
+
+    out_match_fname = os.path.join(".", "brainmatch_scores_engine.csv")
+    out_top_match_fname = os.path.join(
+        ".", "brainmatch_scores_engine_top.csv")
+
+    ret = script_runner.run(
+        "compute_brainmatch_scores.py",
+        "bhg:global",
+        in_projects_fname,
+        in_contributors_fname,
+        in_contributors_fields_fname,
+        out_match_fname,
+        "--n", "2",
+        "--engine", "bitset",
+        "--no-cache")
+
+    assert ret.success
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match_global"])
+    obtained_val = pd.read_csv(out_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    expected_val = pd.read_csv(TEST_FILES["expected_match_global_top"])
+    obtained_val = pd.read_csv(out_top_match_fname)
+
+    pd.testing.assert_frame_equal(obtained_val, expected_val)
+
+    # Test that each engine has its own cached scores
+    cache_dir = os.path.join(tmp_dir.name, "engine_cache")
+
+    for engine in ["bitset", "reference"]:
+        ret = script_runner.run(
+            "compute_brainmatch_scores.py",
+            "bhg:global",
+            in_projects_fname,
+            in_contributors_fname,
+            in_contributors_fields_fname,
+            out_match_fname,
+            "--engine", engine,
+            "--cache_dir", cache_dir)
+
+        assert ret.success
+
+    assert len(os.listdir(cache_dir)) == 2